@@ -575,37 +575,43 @@ class UTF8Deserializer(Serializer):
         return "UTF8Deserializer(%s)" % self.use_unicode
 
 
+# Precompiled structs for the framing helpers below, which run once per record.
+_LONG = struct.Struct("!q")
+_INT = struct.Struct("!i")
+_BOOL = struct.Struct("!?")
+
+
 def read_long(stream):
     length = stream.read(8)
     if not length:
         raise EOFError
-    return struct.unpack("!q", length)[0]
+    return _LONG.unpack(length)[0]
 
 
 def write_long(value, stream):
-    stream.write(struct.pack("!q", value))
+    stream.write(_LONG.pack(value))
 
 
 def pack_long(value):
-    return struct.pack("!q", value)
+    return _LONG.pack(value)
 
 
 def read_int(stream):
     length = stream.read(4)
     if not length:
         raise EOFError
-    return struct.unpack("!i", length)[0]
+    return _INT.unpack(length)[0]
 
 
 def write_int(value, stream):
-    stream.write(struct.pack("!i", value))
+    stream.write(_INT.pack(value))
 
 
 def read_bool(stream):
     length = stream.read(1)
     if not length:
         raise EOFError
-    return struct.unpack("!?", length)[0]
+    return _BOOL.unpack(length)[0]
 
 
 def write_with_length(obj, stream):